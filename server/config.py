@@ -8,6 +8,8 @@ class Settings(BaseSettings):
     app_host: str = "0.0.0.0"
     app_port: int = 8000
     cors_origins: List[str] = ["http://localhost:3000"]
+    log_level: str = "WARNING"  # LOG_LEVEL=DEBUG/INFO for local debugging
+    warmup_timeout: float = 5.0  # seconds; startup warmup gives up after this
 
     # Weaviate
     is_weaviate_cloud: bool = False
@@ -16,6 +18,7 @@ class Settings(BaseSettings):
     weaviate_collection: str = "SOPChunks"
     weaviate_tenant: Optional[str] = None  # optional MT
     weaviate_target_vector: Optional[str] = None
+    weaviate_keepalive_interval: float = 30.0  # seconds between is_ready pings
 
     # local/custom
     http_host: str = "127.0.0.1"
@@ -30,9 +33,15 @@ class Settings(BaseSettings):
     max_context_chars: int = 9000
     weaviate_text_property: str = "text"
     extra_properties: List[str] = ["doc_no", "source_file", "page", "chunk_index", "doc_id"]
+    semantic_cache_size: int = 1024  # 0 disables the semantic cache
+    semantic_cache_ttl: int = 300
+    semantic_cache_threshold: float = 0.95  # cosine similarity for a paraphrase hit
 
     # Gemini
     gemini_embed_model: str = "gemini-embedding-001"
+    embed_batch_size: int = 16      # max queries coalesced into one embed_content call
+    embed_batch_delay: float = 0.05  # seconds to wait for a batch to fill
+    gemini_max_workers: int = 4      # threads for blocking embed calls (keep within RPS quota)
     # (Backend only needs embeddings; Live stays in the browser for latency.)
 
     # Ingestion / chunking
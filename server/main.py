@@ -1,31 +1,69 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Annotated, Optional
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, PlainTextResponse
+from pydantic import BaseModel, ConfigDict, Field
 
 from server.config import get_settings
 from server.services.gemini_service import GeminiService
 from server.services.weaviate_service import WeaviateService
+from server.services.semantic_cache import SemanticCache
 from server.rag.prompts import build_context
 
+settings = get_settings()
+
 logger = logging.getLogger("rag-server")
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=settings.log_level.upper())
+
+class _HealthAccessFilter(logging.Filter):
+    # uvicorn.access args: (client_addr, method, path, http_version, status_code)
+    def filter(self, record: logging.LogRecord) -> bool:
+        args = record.args
+        return not (isinstance(args, tuple) and len(args) >= 3 and args[2] == "/health")
+
+logging.getLogger("uvicorn.access").addFilter(_HealthAccessFilter())
 
-settings = get_settings()
 gemini_service: Optional[GeminiService] = None
 weaviate_service: Optional[WeaviateService] = None
+semantic_cache = SemanticCache(
+    maxsize=settings.semantic_cache_size,
+    ttl=settings.semantic_cache_ttl,
+    threshold=settings.semantic_cache_threshold,
+)
+
+EMPTY_QUERY_RESULT = {"context": "(Empty query)", "sources": []}
+# Serialized once; returned as-is for every empty query
+EMPTY_RESP = JSONResponse(EMPTY_QUERY_RESULT)
+HEALTH_RESP = PlainTextResponse("ok", headers={"Cache-Control": "no-store"})
+
+async def _warmup():
+    vec = await gemini_service.warmup()
+    await weaviate_service.retrieve(query="warmup", query_vector=vec, top_k=1)
+
+async def warmup():
+    # Pay TLS/auth setup and connection-pool creation before the first real query,
+    # but never hold up startup for long if a backend is down
+    try:
+        await asyncio.wait_for(_warmup(), timeout=settings.warmup_timeout)
+    except Exception:
+        logger.warning("Warmup failed; continuing startup", exc_info=True)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     global gemini_service, weaviate_service
     weaviate_service = await WeaviateService.get_instance()
     gemini_service = await GeminiService.get_instance()
+    gemini_service.start_batcher()
+    await warmup()
     yield
+    await gemini_service.stop_batcher()
+    gemini_service.close()
     if weaviate_service:
-        weaviate_service.close()
+        await weaviate_service.close()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -38,29 +76,70 @@ app.add_middleware(
 )
 
 class RetrieveReq(BaseModel):
-    query: str
-    # NEW: Allow top_k override for tool calls
-    top_k: Optional[int] = None
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    query: str = Field(max_length=4096)
+    # Allow top_k override for tool calls (bounded to keep Weaviate calls cheap)
+    top_k: Optional[int] = Field(default=None, ge=1, le=50)
 
 class RetrieveResp(BaseModel):
     context: str
     sources: list[dict]
 
+class BatchRetrieveReq(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    queries: list[Annotated[str, Field(max_length=4096)]] = Field(max_length=32)
+    top_k: Optional[int] = Field(default=None, ge=1, le=50)
+
+class BatchRetrieveResp(BaseModel):
+    results: list[RetrieveResp]
+
 @app.get("/health")
 async def health():
-    return {"ok": True}
+    return HEALTH_RESP
 
+# response_model lets FastAPI serialize straight to JSON bytes via pydantic-core
 @app.post("/api/retrieve", response_model=RetrieveResp)
 async def retrieve(req: RetrieveReq):
     q = (req.query or "").strip()
     if not q:
-        return {"context": "(Empty query)", "sources": []}
+        return EMPTY_RESP
 
     qvec = await gemini_service.embed_query(q)
     
     # Use request top_k if provided, otherwise default to settings
     k = req.top_k if req.top_k else settings.top_k
-    
-    chunks = weaviate_service.retrieve(query=q, query_vector=qvec, top_k=k)
+    logger.debug("retrieve q=%r k=%d", q, k)
+
+    # Paraphrased repeats reuse a previous response without hitting Weaviate
+    cached = semantic_cache.get(qvec, k)
+    if cached is not None:
+        return cached
+
+    chunks = await weaviate_service.retrieve(query=q, query_vector=qvec, top_k=k)
     context, sources = build_context(chunks, settings.max_context_chars)
-    return {"context": context, "sources": sources}
+    resp = {"context": context, "sources": sources}
+    semantic_cache.put(qvec, k, resp)
+    return resp
+
+@app.post("/api/retrieve/batch", response_model=BatchRetrieveResp)
+async def retrieve_batch(req: BatchRetrieveReq):
+    queries = [(q or "").strip() for q in req.queries]
+    k = req.top_k if req.top_k else settings.top_k
+    logger.debug("retrieve batch n=%d k=%d", len(queries), k)
+
+    # One embed RPC for all queries, then hybrid searches run concurrently
+    todo = [q for q in queries if q]
+    vecs = await gemini_service.embed_queries(todo) if todo else []
+    chunk_lists = await weaviate_service.retrieve_many(todo, vecs, k)
+
+    found = iter(chunk_lists)
+    results = []
+    for q in queries:
+        if not q:
+            results.append(EMPTY_QUERY_RESULT)
+            continue
+        context, sources = build_context(next(found), settings.max_context_chars)
+        results.append({"context": context, "sources": sources})
+    return {"results": results}
@@ -1,27 +1,78 @@
-from typing import List, Tuple, Dict
+from typing import Dict, List, Optional, Tuple
+from cachetools import TTLCache
 from server.services.weaviate_service import RetrievedChunk
 
+_SEP = "\n---\n"
+# a truncated chunk shorter than this isn't worth a citation
+_MIN_TRUNCATED_CHARS = 50
+
+# Repeat retrievals (multi-turn on the same topic) return the same chunks;
+# reuse the assembled context instead of rebuilding it.
+_context_cache = TTLCache(maxsize=512, ttl=300)
+
+def _chunks_key(chunks: List[RetrievedChunk], max_chars: int) -> Optional[tuple]:
+    # everything _build_context reads: score, text and all properties
+    # (None if a property value isn't hashable; the caller then skips the cache)
+    key = []
+    for ch in chunks:
+        try:
+            props = frozenset((ch.properties or {}).items())
+        except TypeError:
+            return None
+        key.append((ch.score, ch.text, props))
+    return max_chars, tuple(key)
+
 def build_context(chunks: List[RetrievedChunk], max_chars: int) -> Tuple[str, List[Dict]]:
     if not chunks:
         return "(No relevant documents found)", []
 
-    parts = []
+    key = _chunks_key(chunks, max_chars)
+    if key is None:
+        return _build_context(chunks, max_chars)
+    cached = _context_cache.get(key)
+    if cached is not None:
+        return cached
+    result = _build_context(chunks, max_chars)
+    _context_cache[key] = result
+    return result
+
+def _build_context(chunks: List[RetrievedChunk], max_chars: int) -> Tuple[str, List[Dict]]:
+    pieces = []
     sources = []
     total = 0
 
     for i, ch in enumerate(chunks, start=1):
         p = ch.properties or {}
-        header = f"[Source {i}] (doc_no={p.get('doc_no')}, file={p.get('source_file')}, page={p.get('page')}, chunk={p.get('chunk_index')})"
-        block = f"{header}\n{ch.text}\n"
-        if total + len(block) > max_chars:
+        get = p.get
+        header = f"[Source {i}] (doc_no={get('doc_no')}, file={get('source_file')}, page={get('page')}, chunk={get('chunk_index')})"
+        text = ch.text
+        # block is header + "\n" + text + "\n"; size it before building anything
+        remaining = max_chars - total - len(header) - 2
+        if remaining <= 0:
             break
-        parts.append(block)
-        total += len(block)
+        truncated = len(text) > remaining
+        if truncated:
+            # keep the header intact, cut the text (at a word boundary if possible)
+            text = text[:remaining]
+            cut = text.rfind(" ")
+            if cut > 0:
+                text = text[:cut]
+            if len(text) < _MIN_TRUNCATED_CHARS:
+                break
+        if pieces:
+            pieces.append(_SEP)
+        pieces += (header, "\n", text, "\n")
+        total += len(header) + len(text) + 2
+
+        props = dict(p)
+        props.pop("text", None)
         sources.append({
             "id": f"source_{i}",
             "score": ch.score,
             "text_preview": ch.text_preview,
-            "properties": {k: v for k, v in p.items() if k != "text"},
+            "properties": props,
         })
+        if truncated:
+            break
 
-    return "\n---\n".join(parts), sources
+    return "".join(pieces), sources
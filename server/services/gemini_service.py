@@ -1,5 +1,7 @@
 import asyncio
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+import numpy as np
 from cachetools import TTLCache
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -8,6 +10,18 @@ from google.genai import types
 
 from server.config import get_settings
 
+def _quantize(vec: List[float]) -> Tuple[np.ndarray, float]:
+    # int8 with a per-vector absmax scale (~4x smaller than fp32, cosine ~0.9999)
+    arr = np.asarray(vec, dtype=np.float32)
+    scale = float(np.abs(arr).max()) if arr.size else 0.0
+    if not scale:
+        return np.zeros(arr.shape, dtype=np.int8), 0.0
+    return np.round(arr / scale * 127).astype(np.int8), scale
+
+def _dequantize(q: Tuple[np.ndarray, float]) -> List[float]:
+    arr, scale = q
+    return (arr.astype(np.float32) * (scale / 127)).tolist()
+
 class GeminiService:
     _instance: Optional["GeminiService"] = None
     _lock = asyncio.Lock()
@@ -15,8 +29,19 @@ class GeminiService:
     def __init__(self):
         self.settings = get_settings()
         self.client = genai.Client()
-        # small cache: repeated queries get same embedding quickly
+        # dedicated pool so embed RPCs don't compete with other blocking work
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.settings.gemini_max_workers,
+            thread_name_prefix="gemini-embed",
+        )
+        # small cache: repeated queries get same embedding quickly (int8-quantized)
         self._embed_cache = TTLCache(maxsize=2048, ttl=300)
+        # dynamic batcher: concurrent embed_query calls share one embed_content RPC
+        self._queue: "asyncio.Queue[Tuple[str, asyncio.Future]]" = asyncio.Queue()
+        self._batch_task: Optional[asyncio.Task] = None
+        # worker slots: batches embed concurrently, bounded by the embed thread pool size
+        self._batch_slots = asyncio.Semaphore(self.settings.gemini_max_workers)
+        self._inflight: Set[asyncio.Task] = set()
 
     @classmethod
     async def get_instance(cls) -> "GeminiService":
@@ -26,6 +51,85 @@ class GeminiService:
                     cls._instance = cls()
         return cls._instance
 
+    def start_batcher(self):
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = asyncio.create_task(self._batch_loop())
+
+    async def stop_batcher(self):
+        if self._batch_task is None:
+            return
+        self._batch_task.cancel()
+        for task in self._inflight:
+            task.cancel()
+        await asyncio.gather(self._batch_task, *self._inflight, return_exceptions=True)
+        self._batch_task = None
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        max_size = max(1, self.settings.embed_batch_size)
+        max_delay = self.settings.embed_batch_delay
+        while True:
+            batch = [await self._queue.get()]
+            # hold a worker slot before collecting: while all workers are busy,
+            # queries pile up in the queue and go out together as one batch
+            await self._batch_slots.acquire()
+            try:
+                while len(batch) < max_size and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                # a lone query with a free slot goes out immediately; only wait
+                # for stragglers during a burst
+                if len(batch) > 1:
+                    deadline = loop.time() + max_delay
+                    while len(batch) < max_size:
+                        timeout = deadline - loop.time()
+                        if timeout <= 0:
+                            break
+                        try:
+                            batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                        except asyncio.TimeoutError:
+                            break
+            except BaseException:
+                self._batch_slots.release()
+                for _, fut in batch:
+                    fut.cancel()
+                raise
+            # dispatch without waiting so the next batch can be collected meanwhile;
+            # the task releases the slot when it finishes
+            task = asyncio.create_task(self._embed_batch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._batch_done)
+
+    def _batch_done(self, task: asyncio.Task):
+        self._inflight.discard(task)
+        self._batch_slots.release()
+
+    async def _embed_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        # identical texts in one batch are embedded once
+        unique: Dict[str, int] = {}
+        for text, _ in batch:
+            unique.setdefault(text, len(unique))
+        texts = list(unique)
+
+        loop = asyncio.get_running_loop()
+        try:
+            vecs = await loop.run_in_executor(self._executor, lambda: self.embed_texts(texts, "RETRIEVAL_QUERY"))
+        except asyncio.CancelledError:
+            for _, fut in batch:
+                fut.cancel()
+            raise
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+
+        for text, fut in batch:
+            if not fut.done():
+                fut.set_result(vecs[unique[text]])
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=8))
     def embed_texts(self, texts: List[str], task_type: str) -> List[List[float]]:
         # Gemini embeddings API. 
@@ -38,10 +142,41 @@ class GeminiService:
 
     async def embed_query(self, text: str) -> List[float]:
         key = ("q", text)
-        if key in self._embed_cache:
-            return self._embed_cache[key]
+        cached = self._embed_cache.get(key)
+        if cached is not None:
+            return _dequantize(cached)
+
+        self.start_batcher()
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, fut))
+        q = _quantize(await fut)
+        self._embed_cache[key] = q
+        # return the cached form so results don't depend on cache state
+        return _dequantize(q)
+
+    async def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        # One embed_content call for every uncached text in the list
+        # (results are collected locally: cache entries may expire/evict across the await)
+        found: Dict[str, List[float]] = {}
+        missing = []
+        for t in dict.fromkeys(texts):
+            cached = self._embed_cache.get(("q", t))
+            if cached is not None:
+                found[t] = _dequantize(cached)
+            else:
+                missing.append(t)
+        if missing:
+            loop = asyncio.get_running_loop()
+            vecs = await loop.run_in_executor(self._executor, lambda: self.embed_texts(missing, "RETRIEVAL_QUERY"))
+            for t, v in zip(missing, vecs):
+                q = _quantize(v)
+                self._embed_cache[("q", t)] = q
+                found[t] = _dequantize(q)
+        return [found[t] for t in texts]
 
-        loop = asyncio.get_event_loop()
-        vec = (await loop.run_in_executor(None, lambda: self.embed_texts([text], "RETRIEVAL_QUERY")))[0]
-        self._embed_cache[key] = vec
-        return vec
+    async def warmup(self) -> List[float]:
+        # One attempt on the embed executor; skips the retry backoff so startup fails fast
+        embed_once = self.embed_texts.retry_with(stop=stop_after_attempt(1))
+        loop = asyncio.get_running_loop()
+        vecs = await loop.run_in_executor(self._executor, lambda: embed_once(self, ["warmup"], "RETRIEVAL_QUERY"))
+        return vecs[0]
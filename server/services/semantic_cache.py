@@ -0,0 +1,66 @@
+import time
+from typing import Any, List, Optional
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    In-memory cache of retrieve responses keyed by query embedding.
+    A lookup hits when a cached query vector has cosine similarity >= threshold
+    (and the same top_k). Fixed-size ring buffer with TTL eviction; maxsize <= 0
+    disables the cache.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300, threshold: float = 0.95):
+        self.maxsize = max(0, maxsize)
+        self.ttl = ttl
+        self.threshold = threshold
+        self._matrix: Optional[np.ndarray] = None  # (maxsize, dim), L2-normalized rows
+        self._expires = np.zeros(self.maxsize, dtype=np.float64)
+        self._top_k = np.zeros(self.maxsize, dtype=np.int64)
+        self._values: List[Any] = [None] * self.maxsize
+        self._next = 0
+        self._size = 0
+
+    @staticmethod
+    def _normalize(vec) -> Optional[np.ndarray]:
+        arr = np.asarray(vec, dtype=np.float32)
+        norm = float(np.linalg.norm(arr))
+        if norm == 0.0:
+            return None
+        return arr / norm
+
+    def get(self, vec, top_k: int) -> Optional[Any]:
+        if self._matrix is None or self._size == 0:
+            return None
+        q = self._normalize(vec)
+        if q is None or q.shape[0] != self._matrix.shape[1]:
+            return None
+
+        n = self._size
+        sims = self._matrix[:n] @ q
+        stale = (self._expires[:n] < time.monotonic()) | (self._top_k[:n] != top_k)
+        sims[stale] = -np.inf
+        i = int(np.argmax(sims))
+        if sims[i] >= self.threshold:
+            return self._values[i]
+        return None
+
+    def put(self, vec, top_k: int, value: Any) -> None:
+        if self.maxsize == 0:
+            return
+        q = self._normalize(vec)
+        if q is None:
+            return
+        if self._matrix is None or self._matrix.shape[1] != q.shape[0]:
+            self._matrix = np.zeros((self.maxsize, q.shape[0]), dtype=np.float32)
+            self._next = self._size = 0
+
+        i = self._next
+        self._matrix[i] = q
+        self._expires[i] = time.monotonic() + self.ttl
+        self._top_k[i] = top_k
+        self._values[i] = value
+        self._next = (i + 1) % self.maxsize
+        self._size = min(self._size + 1, self.maxsize)
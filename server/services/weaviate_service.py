@@ -25,38 +25,65 @@ class WeaviateService:
 
     def __init__(self):
         self.settings = get_settings()
-        self.client = self._connect()
-        self._ensure_collection()
+        self.client: Optional[weaviate.WeaviateAsyncClient] = None
+        # immutable query shape, built once instead of per retrieve()
+        self._text_prop = self.settings.weaviate_text_property
+        self._props = list(dict.fromkeys([self._text_prop] + self.settings.extra_properties))
+        self._meta = MetadataQuery(score=True)
+        self._base_kwargs: Dict[str, Any] = dict(
+            return_properties=self._props,
+            return_metadata=self._meta,
+        )
+        if self.settings.weaviate_target_vector:
+            self._base_kwargs["target_vector"] = self.settings.weaviate_target_vector
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._col = None  # collection handle (tenant-bound), set by _ensure_collection
 
     @classmethod
     async def get_instance(cls) -> "WeaviateService":
         if cls._instance is None:
             async with cls._lock:
                 if cls._instance is None:
-                    cls._instance = cls()
+                    inst = cls()
+                    inst.client = await inst._connect()
+                    await inst._ensure_collection()
+                    inst._keepalive_task = asyncio.create_task(inst._keepalive())
+                    cls._instance = inst
         return cls._instance
 
-    def close(self):
+    async def close(self):
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
         try:
-            self.client.close()
+            await self.client.close()
         except Exception:
             pass
 
-    def _connect(self) -> weaviate.WeaviateClient:
+    async def _keepalive(self):
+        # periodic cheap call keeps the HTTP/gRPC connections warm
+        while True:
+            await asyncio.sleep(self.settings.weaviate_keepalive_interval)
+            try:
+                await self.client.is_ready()
+            except Exception:
+                pass
+
+    async def _connect(self) -> weaviate.WeaviateAsyncClient:
         timeout_config = AdditionalConfig(timeout=Timeout(init=30, query=60, insert=120))
         auth = Auth.api_key(self.settings.weaviate_api_key) if self.settings.weaviate_api_key else None
 
         if self.settings.is_weaviate_cloud:
             if not self.settings.weaviate_url:
                 raise RuntimeError("WEAVIATE_URL is required for cloud mode")
-            client = weaviate.connect_to_weaviate_cloud(
+            client = weaviate.use_async_with_weaviate_cloud(
                 cluster_url=self.settings.weaviate_url,
                 auth_credentials=auth,
                 additional_config=timeout_config,
                 skip_init_checks=False,
             )
         else:
-            client = weaviate.connect_to_custom(
+            client = weaviate.use_async_with_custom(
                 http_host=self.settings.http_host,
                 http_port=self.settings.http_port,
                 http_secure=self.settings.http_secure,
@@ -68,7 +95,8 @@ class WeaviateService:
                 skip_init_checks=False,
             )
 
-        if not client.is_ready():
+        await client.connect()
+        if not await client.is_ready():
             raise RuntimeError("Weaviate not ready")
         return client
 
@@ -78,13 +106,14 @@ class WeaviateService:
             c = c.with_tenant(self.settings.weaviate_tenant)
         return c
 
-    def _ensure_collection(self):
+    async def _ensure_collection(self):
         # If you already created it with your pipeline, this is a no-op.
-        existing = self.client.collections.list_all()
+        existing = await self.client.collections.list_all()
         if self.settings.weaviate_collection in existing:
+            self._col = self._collection()
             return
 
-        self.client.collections.create(
+        await self.client.collections.create(
             name=self.settings.weaviate_collection,
             vector_config=wvcc.Configure.Vectors.self_provided(
                 vector_index_config=wvcc.Configure.VectorIndex.hnsw(
@@ -100,34 +129,36 @@ class WeaviateService:
                 wvcc.Property(name="text", data_type=wvcc.DataType.TEXT),
             ],
         )
+        self._col = self._collection()
 
-    def retrieve(self, query: str, query_vector: List[float], top_k: int) -> List[RetrievedChunk]:
+    async def retrieve(self, query: str, query_vector: List[float], top_k: int) -> List[RetrievedChunk]:
         # Hybrid search combines lexical + vector. 
-        c = self._collection()
-        props = list(dict.fromkeys([self.settings.weaviate_text_property] + self.settings.extra_properties))
-        meta = MetadataQuery(score=True)
-
-        kwargs = dict(
-            query=query,
-            vector=query_vector,
-            limit=top_k,
-            return_properties=props,
-            return_metadata=meta,
-        )
-        if self.settings.weaviate_target_vector:
-            kwargs["target_vector"] = self.settings.weaviate_target_vector
-
-        res = c.query.hybrid(**kwargs)
+        c = self._col
+        res = await c.query.hybrid(query=query, vector=query_vector, limit=top_k, **self._base_kwargs)
         out: List[RetrievedChunk] = []
+        chunk = RetrievedChunk
+        text_prop = self._text_prop
         for obj in res.objects:
-            p = obj.properties or {}
-            text = p.get(self.settings.weaviate_text_property)
-            if not isinstance(text, str) or not text.strip():
+            p = obj.properties
+            if not p:
+                continue
+            text = p.get(text_prop)
+            if not isinstance(text, str):
                 continue
-            md = getattr(obj, "metadata", None)
-            out.append(RetrievedChunk(
-                text=text.strip(),
-                score=getattr(md, "score", None),
-                properties=p,
-            ))
+            text = text.strip()
+            if not text:
+                continue
+            try:
+                score = obj.metadata.score
+            except AttributeError:
+                score = None
+            out.append(chunk(text=text, score=score, properties=p))
         return out
+
+    async def retrieve_many(
+        self, queries: List[str], query_vectors: List[List[float]], top_k: int
+    ) -> List[List[RetrievedChunk]]:
+        # Hybrid searches run concurrently over the shared connection/collection handle
+        return await asyncio.gather(*[
+            self.retrieve(q, v, top_k) for q, v in zip(queries, query_vectors)
+        ])